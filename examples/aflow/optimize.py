@@ -71,6 +71,16 @@ def parse_args():
     parser.add_argument("--max_rounds", type=int, default=20, help="Max iteration rounds")
     parser.add_argument("--check_convergence", type=bool, default=True, help="Whether to enable early stop")
     parser.add_argument("--validation_rounds", type=int, default=5, help="Validation rounds")
+    parser.add_argument(
+        "--mode",
+        type=str,
+        default="Graph",
+        choices=["Graph", "Pipeline"],
+        help="'Pipeline' runs the validation rounds concurrently and generates the next graph while scoring",
+    )
+    parser.add_argument(
+        "--max_concurrent_tasks", type=int, default=50, help="Problems evaluated at once in the 'Pipeline' mode"
+    )
     parser.add_argument(
         "--if_first_optimize",
         type=lambda x: x.lower() == "true",
@@ -127,10 +137,11 @@ if __name__ == "__main__":
         initial_round=args.initial_round,
         max_rounds=args.max_rounds,
         validation_rounds=args.validation_rounds,
+        max_concurrent_tasks=args.max_concurrent_tasks,
     )
 
-    # Optimize workflow via setting the optimizer's mode to 'Graph'
-    optimizer.optimize("Graph")
+    # Optimize workflow via setting the optimizer's mode to 'Graph', or 'Pipeline' to overlap the rounds
+    optimizer.optimize(args.mode)
 
     # Test workflow via setting the optimizer's mode to 'Test'
     # optimizer.optimize("Test")